@@ -3,83 +3,221 @@ Main FastAPI application for 3D Stadium Website backend.
 
 This backend is prepared for future expansion to support:
 - Stadium data API endpoints
-- User preference management  
+- User preference management
 - Analytics and usage tracking
 - Real-time stadium information
 """
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import hashlib
+import orjson
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from .middleware import CORSGateMiddleware, StaticResponseCache
 
 # Initialize FastAPI application
 app = FastAPI(
     title="3D Stadium Website API",
     description="Backend API for interactive 3D stadium visualization",
-    version="0.1.0"
+    version="0.1.0",
+    # Reason: orjson's C encoder is ~5-10x faster than the stdlib json
+    # module, so every future endpoint gets fast serialization by default.
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS for frontend development
+# Configure CORS for frontend development. The gate skips CORS handling
+# entirely for requests without an Origin header (health checks, internal
+# traffic), so only real browser traffic pays for it.
+# Reason: explicit method/header lists let the middleware answer preflights
+# with cached constant values instead of echoing request headers back
+# dynamically, as the "*" wildcards force it to.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3006", "http://localhost:8080"],
+    CORSGateMiddleware,
+    allow_origins=("http://localhost:3000", "http://localhost:3006", "http://localhost:8080"),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "HEAD", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+)
+
+# Compress larger responses (notably /openapi.json) when the client sends
+# Accept-Encoding: gzip. Reason: cuts 60-80% of bytes on the wire for a
+# small C-level deflate cost; tiny payloads below the threshold are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Memoize the full raw response (status, headers, body) for the static GET
+# endpoints. Added last so it sits outermost: a cache hit replays recorded
+# bytes without touching gzip, CORS, routing, or the handlers at all.
+app.add_middleware(
+    StaticResponseCache,
+    paths=("/", "/health", "/api/stadium/info", "/openapi.json"),
 )
 
-@app.get("/")
-async def root() -> Dict[str, str]:
+# These payloads are constant between deploys: build each dict exactly once
+# at import, freeze it behind a read-only proxy so no handler can mutate or
+# reallocate it, and serialize it once. Reason: the per-request hot path
+# then touches no fresh dict/list allocations and no JSON encoder at all.
+_ROOT_INFO: Mapping[str, Any] = MappingProxyType({
+    "message": "3D Stadium Website API",
+    "version": "0.1.0",
+    "status": "operational"
+})
+
+_HEALTH_INFO: Mapping[str, Any] = MappingProxyType({
+    "status": "healthy",
+    "service": "3d-stadium-backend",
+    "version": "0.1.0"
+})
+
+_STADIUM_INFO: Mapping[str, Any] = MappingProxyType({
+    "name": "Interactive Football Stadium",
+    "type": "football",
+    "capacity": 50000,
+    "features": (
+        "3D visualization",
+        "Interactive camera controls",
+        "Cinematic lighting effects",
+        "Bloom post-processing",
+        "Atmospheric particles"
+    )
+})
+
+# orjson serializes plain dicts only, so unwrap the proxies for the one-time
+# encode; tuples serialize as JSON arrays.
+_ROOT_BYTES = orjson.dumps(dict(_ROOT_INFO))
+_STADIUM_BYTES = orjson.dumps(dict(_STADIUM_INFO))
+
+# /health is the hottest path (monitoring pollers), so its body is a
+# hand-written bytes literal — no encoder runs even at import. The assert
+# keeps the literal in sync with the frozen mapping above.
+_HEALTH_BYTES = b'{"status":"healthy","service":"3d-stadium-backend","version":"0.1.0"}'
+assert _HEALTH_BYTES == orjson.dumps(dict(_HEALTH_INFO))
+
+def _etag_for(body: bytes) -> str:
+    """
+    Compute a strong ETag for a precomputed response body.
+
+    Args:
+        body (bytes): The serialized response payload.
+
+    Returns:
+        str: A quoted strong ETag derived from a hash of the body.
+    """
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+_ROOT_ETAG = _etag_for(_ROOT_BYTES)
+_HEALTH_ETAG = _etag_for(_HEALTH_BYTES)
+_STADIUM_ETAG = _etag_for(_STADIUM_BYTES)
+
+def _cached_json(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """
+    Serve a precomputed JSON body with ETag revalidation support.
+
+    Args:
+        request (Request): Incoming request, checked for If-None-Match.
+        body (bytes): Precomputed JSON payload.
+        etag (str): Strong ETag for the payload.
+        cache_control (str): Cache-Control header value to emit.
+
+    Returns:
+        Response: 304 with no body on an ETag match, otherwise the payload.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    # Reason: a matching ETag lets us skip body transmission entirely;
+    # repeat GETs from cached clients become empty 304s.
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/", response_model=None)
+async def root(request: Request) -> Response:
     """
     Root endpoint providing basic API information.
-    
+
+    Args:
+        request (Request): Incoming request, used for cache revalidation.
+
     Returns:
-        dict: Basic API status and information
+        Response: Precomputed JSON with basic API status and information
     """
-    return {
-        "message": "3D Stadium Website API",
-        "version": "0.1.0",
-        "status": "operational"
-    }
-
-@app.get("/health")
-async def health_check() -> Dict[str, Any]:
+    return _cached_json(request, _ROOT_BYTES, _ROOT_ETAG, "public, max-age=3600")
+
+@app.get("/health", response_model=None)
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint for monitoring and deployment.
-    
+
+    Args:
+        request (Request): Incoming request, used for cache revalidation.
+
     Returns:
-        dict: Service health status and basic metrics
+        Response: Precomputed JSON with service health status
+    """
+    # Reason: no-cache keeps monitoring pollers revalidating every probe
+    # while still letting them receive bodyless 304s.
+    return _cached_json(request, _HEALTH_BYTES, _HEALTH_ETAG, "no-cache")
+
+@app.head("/health", response_model=None, include_in_schema=False)
+async def health_check_head() -> Response:
     """
-    return {
-        "status": "healthy",
-        "service": "3d-stadium-backend",
-        "version": "0.1.0"
-    }
-
-@app.get("/api/stadium/info")
-async def get_stadium_info() -> Dict[str, Any]:
+    HEAD variant of the health check for monitoring pollers.
+
+    Returns:
+        Response: Empty 200 with a JSON content type and no body
+    """
+    # Reason: pollers hit this at the highest QPS of any endpoint; an
+    # explicit HEAD route skips body construction and the GET handler.
+    return Response(status_code=200, media_type="application/json")
+
+@app.get("/api/stadium/info", response_model=None)
+async def get_stadium_info(request: Request) -> Response:
     """
     Get basic stadium information.
     Placeholder for future stadium data integration.
-    
+
+    Args:
+        request (Request): Incoming request, used for cache revalidation.
+
+    Returns:
+        Response: Precomputed JSON with stadium metadata
+    """
+    return _cached_json(request, _STADIUM_BYTES, _STADIUM_ETAG, "public, max-age=3600")
+
+# The OpenAPI schema is immutable once the routes above are registered, so
+# encode it once and replace FastAPI's default route. Reason: the default
+# route re-serializes the full schema dict on every /openapi.json request.
+_OPENAPI_BYTES = orjson.dumps(app.openapi())
+app.router.routes = [r for r in app.router.routes if getattr(r, "path", None) != "/openapi.json"]
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema() -> Response:
+    """
+    Serve the precomputed OpenAPI schema.
+
     Returns:
-        dict: Stadium metadata and information
+        Response: Cached JSON-encoded OpenAPI document
     """
-    return {
-        "name": "Interactive Football Stadium",
-        "type": "football",
-        "capacity": 50000,
-        "features": [
-            "3D visualization",
-            "Interactive camera controls", 
-            "Cinematic lighting effects",
-            "Bloom post-processing",
-            "Atmospheric particles"
-        ]
-    }
+    return Response(content=_OPENAPI_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Reason: uvloop (libuv event loop) and httptools (C HTTP parser)
+    # roughly double small-response throughput over the default
+    # asyncio/h11 stack; both ship with uvicorn[standard].
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        # Reason: one worker process per core escapes the GIL for
+        # CPU-bound request handling; WEB_CONCURRENCY overrides in Docker.
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        # Reason: the access log formats a LogRecord per request; warnings
+        # and errors are all that matter once responses are this cheap.
+        access_log=False,
+        log_level="warning",
+    )
@@ -0,0 +1,157 @@
+"""
+Custom ASGI middleware for the 3D Stadium Website backend.
+
+These classes work on the raw ASGI scope rather than Starlette's Request
+wrapper so the per-request hot path stays allocation-free.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class FrozenOriginCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware with an O(1) frozenset origin lookup.
+
+    Starlette scans its allow_origins list linearly on every CORS request;
+    a hashed frozenset membership test replaces that scan.
+    """
+
+    def __init__(self, app: ASGIApp, **options) -> None:
+        """
+        Initialize the middleware and precompute the origin set.
+
+        Args:
+            app (ASGIApp): The downstream ASGI application.
+            **options: Keyword options forwarded to CORSMiddleware.
+        """
+        super().__init__(app, **options)
+        self._origin_set = frozenset(options.get("allow_origins", ()))
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        """
+        Check an Origin header value against the configured origins.
+
+        Args:
+            origin (str): The decoded Origin header value.
+
+        Returns:
+            bool: True if the origin may make CORS requests.
+        """
+        if self.allow_all_origins:
+            return True
+        # Reason: regex origins need Starlette's matching; the common exact
+        # match is a single hashed lookup instead of a linear scan.
+        if self.allow_origin_regex is not None:
+            return super().is_allowed_origin(origin)
+        return origin in self._origin_set
+
+
+class CORSGateMiddleware:
+    """
+    Run CORSMiddleware only for requests that actually carry an Origin header.
+
+    Server-to-server traffic (health checks, monitoring pollers) never sends
+    Origin, so the majority path skips origin matching and CORS header
+    injection entirely and goes straight to the app.
+    """
+
+    def __init__(self, app: ASGIApp, **cors_options) -> None:
+        """
+        Initialize the gate and the wrapped CORS middleware.
+
+        Args:
+            app (ASGIApp): The downstream ASGI application.
+            **cors_options: Keyword options forwarded to CORSMiddleware.
+        """
+        self.app = app
+        self.cors = FrozenOriginCORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Dispatch the request, bypassing CORS handling when possible.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive callable.
+            send (Send): ASGI send callable.
+        """
+        # Reason: checking the raw header list avoids building Starlette's
+        # Headers wrapper for the common no-Origin case.
+        if scope["type"] == "http" and not any(k == b"origin" for k, _ in scope["headers"]):
+            await self.app(scope, receive, send)
+            return
+        await self.cors(scope, receive, send)
+
+
+class StaticResponseCache:
+    """
+    Replay full responses for a fixed set of idempotent GET paths.
+
+    The first GET to a configured path records the raw http.response.*
+    messages on the way out and stores them keyed by (path, accept-encoding).
+    Later hits replay the stored messages directly, skipping the app and the
+    rest of the middleware chain. Requests whose responses vary per client
+    (CORS Origin, conditional If-None-Match) bypass the cache, as do
+    non-GET methods.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]) -> None:
+        """
+        Initialize the cache for a fixed set of paths.
+
+        Args:
+            app (ASGIApp): The downstream ASGI application.
+            paths (Iterable[str]): Request paths whose responses never change.
+        """
+        self.app = app
+        self.paths = frozenset(paths)
+        self._cache: Dict[Tuple[str, bytes], Tuple[Message, ...]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve from the cache when possible, recording on the first miss.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive callable.
+            send (Send): ASGI send callable.
+        """
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Reason: Origin changes CORS headers and If-None-Match changes the
+        # status code, so those requests must reach the real handlers.
+        accept_encoding = b""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value
+            elif key in (b"origin", b"if-none-match"):
+                await self.app(scope, receive, send)
+                return
+
+        cache_key = (scope["path"], accept_encoding)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            for message in cached:
+                await send(message)
+            return
+
+        messages = []
+
+        async def record(message: Message) -> None:
+            messages.append(message)
+            await send(message)
+
+        await self.app(scope, receive, record)
+
+        # Only successful, fully sent responses are worth replaying.
+        if messages and messages[0]["type"] == "http.response.start" and messages[0]["status"] == 200:
+            self._cache[cache_key] = tuple(messages)
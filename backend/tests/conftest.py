@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures for the backend test suite.
+
+Provides one ASGI-transport HTTP client for the whole session so each test
+reuses the same event loop and transport instead of spinning up a fresh
+portal per request.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Provide a session-scoped event loop for session-scoped async fixtures.
+
+    Returns:
+        asyncio.AbstractEventLoop: Event loop shared by the whole session.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """
+    Provide a single AsyncClient wired directly to the ASGI app.
+
+    Yields:
+        AsyncClient: HTTP client shared across all tests in the session.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
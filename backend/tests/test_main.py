@@ -3,86 +3,88 @@ Unit tests for the main FastAPI application.
 
 Tests basic endpoints, CORS configuration, and API responses.
 Following the three-test pattern: expected use, edge case, failure case.
+
+All tests run against the session-scoped ASGI client from conftest.py so the
+suite shares one event loop and transport instead of paying portal
+setup/teardown per request.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.asyncio
 
 
 class TestRootEndpoint:
     """Tests for the root endpoint (/.)"""
-    
-    def test_root_endpoint_returns_success(self):
+
+    async def test_root_endpoint_returns_success(self, client):
         """
         Test that root endpoint returns successful response.
         Expected use case.
         """
-        response = client.get("/")
-        
+        response = await client.get("/")
+
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "version" in data
         assert "status" in data
         assert data["status"] == "operational"
-    
-    def test_root_endpoint_content_type(self):
+
+    async def test_root_endpoint_content_type(self, client):
         """
         Test that root endpoint returns correct content type.
         Edge case for content validation.
         """
-        response = client.get("/")
-        
+        response = await client.get("/")
+
         assert response.headers["content-type"] == "application/json"
-    
-    def test_root_endpoint_with_invalid_method(self):
+
+    async def test_root_endpoint_with_invalid_method(self, client):
         """
         Test that root endpoint rejects invalid HTTP methods.
         Failure case.
         """
-        response = client.post("/")
-        
+        response = await client.post("/")
+
         assert response.status_code == 405  # Method Not Allowed
 
 
 class TestHealthEndpoint:
     """Tests for the health check endpoint (/health)."""
-    
-    def test_health_check_returns_healthy(self):
+
+    async def test_health_check_returns_healthy(self, client):
         """
         Test that health check returns healthy status.
         Expected use case.
         """
-        response = client.get("/health")
-        
+        response = await client.get("/health")
+
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert "service" in data
         assert "version" in data
-    
-    def test_health_check_response_structure(self):
+
+    async def test_health_check_response_structure(self, client):
         """
         Test that health check response has correct structure.
         Edge case for response validation.
         """
-        response = client.get("/health")
+        response = await client.get("/health")
         data = response.json()
-        
+
         required_fields = ["status", "service", "version"]
         for field in required_fields:
             assert field in data, f"Missing required field: {field}"
-    
-    def test_health_check_with_head_request(self):
+
+    async def test_health_check_with_head_request(self, client):
         """
         Test health check with HEAD request (monitoring use case).
         Edge case for monitoring tools.
         """
-        response = client.head("/health")
-        
+        response = await client.head("/health")
+
         # HEAD requests should return same status but no body
         assert response.status_code == 200
         assert response.content == b""
@@ -90,52 +92,52 @@ class TestHealthEndpoint:
 
 class TestStadiumInfoEndpoint:
     """Tests for the stadium info endpoint (/api/stadium/info)."""
-    
-    def test_stadium_info_returns_data(self):
+
+    async def test_stadium_info_returns_data(self, client):
         """
         Test that stadium info endpoint returns expected data.
         Expected use case.
         """
-        response = client.get("/api/stadium/info")
-        
+        response = await client.get("/api/stadium/info")
+
         assert response.status_code == 200
         data = response.json()
-        
+
         # Validate required fields
         assert "name" in data
         assert "type" in data
         assert "capacity" in data
         assert "features" in data
-        
+
         # Validate data types
         assert isinstance(data["capacity"], int)
         assert isinstance(data["features"], list)
         assert data["type"] == "football"
-    
-    def test_stadium_info_features_list(self):
+
+    async def test_stadium_info_features_list(self, client):
         """
         Test that stadium features list contains expected items.
         Edge case for feature validation.
         """
-        response = client.get("/api/stadium/info")
+        response = await client.get("/api/stadium/info")
         data = response.json()
-        
+
         features = data["features"]
         expected_features = [
             "3D visualization",
             "Interactive camera controls"
         ]
-        
+
         for feature in expected_features:
             assert feature in features
-    
-    def test_stadium_info_with_query_params(self):
+
+    async def test_stadium_info_with_query_params(self, client):
         """
         Test stadium info endpoint ignores unexpected query parameters.
         Failure case for parameter handling.
         """
-        response = client.get("/api/stadium/info?invalid=param")
-        
+        response = await client.get("/api/stadium/info?invalid=param")
+
         # Should still return 200 and ignore invalid params
         assert response.status_code == 200
         data = response.json()
@@ -144,8 +146,8 @@ class TestStadiumInfoEndpoint:
 
 class TestCORSConfiguration:
     """Tests for CORS middleware configuration."""
-    
-    def test_cors_preflight_request(self):
+
+    async def test_cors_preflight_request(self, client):
         """
         Test CORS preflight request handling.
         Expected use case for frontend integration.
@@ -155,74 +157,110 @@ class TestCORSConfiguration:
             "Access-Control-Request-Method": "GET",
             "Access-Control-Request-Headers": "Content-Type"
         }
-        
-        response = client.options("/", headers=headers)
-        
+
+        response = await client.options("/", headers=headers)
+
         # Should allow the request
         assert response.status_code == 200
         assert "access-control-allow-origin" in response.headers
-    
-    def test_cors_actual_request(self):
+
+    async def test_cors_actual_request(self, client):
         """
         Test actual CORS request with origin header.
         Expected use case.
         """
         headers = {"Origin": "http://localhost:3006"}
-        
-        response = client.get("/", headers=headers)
-        
+
+        response = await client.get("/", headers=headers)
+
         assert response.status_code == 200
         assert "access-control-allow-origin" in response.headers
-    
-    def test_cors_unauthorized_origin(self):
+
+    async def test_cors_unauthorized_origin(self, client):
         """
         Test CORS with unauthorized origin.
         Edge case for security.
         """
         headers = {"Origin": "http://malicious-site.com"}
-        
-        response = client.get("/", headers=headers)
-        
+
+        response = await client.get("/", headers=headers)
+
         # Should still return 200 but may not include CORS headers
         # (exact behavior depends on CORS middleware configuration)
         assert response.status_code == 200
 
 
+class TestStaticResponseCache:
+    """Tests for the static response cache middleware."""
+
+    async def test_repeated_requests_return_identical_responses(self, client):
+        """
+        Test that a cached replay matches the original response exactly.
+        Expected use case.
+        """
+        first = await client.get("/api/stadium/info")
+        second = await client.get("/api/stadium/info")
+
+        assert second.status_code == first.status_code == 200
+        assert second.content == first.content
+        assert second.headers["content-type"] == first.headers["content-type"]
+
+    async def test_cors_request_bypasses_cache(self, client):
+        """
+        Test that requests with an Origin header still get CORS headers
+        after the cache is warm. Edge case.
+        """
+        await client.get("/")  # warm the cache without an Origin header
+        response = await client.get("/", headers={"Origin": "http://localhost:3006"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" in response.headers
+
+    async def test_non_get_methods_are_not_cached(self, client):
+        """
+        Test that non-GET methods fall through to normal routing.
+        Failure case.
+        """
+        response = await client.post("/health")
+
+        assert response.status_code == 405
+
+
 class TestAPIDocumentation:
     """Tests for API documentation endpoints."""
-    
-    def test_openapi_docs_accessible(self):
+
+    async def test_openapi_docs_accessible(self, client):
         """
         Test that OpenAPI documentation is accessible.
         Expected use case for development.
         """
-        response = client.get("/docs")
-        
+        response = await client.get("/docs")
+
         assert response.status_code == 200
         # Should return HTML content
         assert "text/html" in response.headers.get("content-type", "")
-    
-    def test_redoc_docs_accessible(self):
+
+    async def test_redoc_docs_accessible(self, client):
         """
         Test that ReDoc documentation is accessible.
         Edge case for alternative documentation.
         """
-        response = client.get("/redoc")
-        
+        response = await client.get("/redoc")
+
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
-    
-    def test_openapi_json_schema(self):
+
+    async def test_openapi_json_schema(self, client):
         """
         Test that OpenAPI JSON schema is valid.
         Edge case for API schema validation.
         """
-        response = client.get("/openapi.json")
-        
+        response = await client.get("/openapi.json")
+
         assert response.status_code == 200
         assert response.headers["content-type"] == "application/json"
-        
+
         data = response.json()
         assert "openapi" in data
         assert "info" in data
-        assert "paths" in data
\ No newline at end of file
+        assert "paths" in data